@@ -22,37 +22,78 @@ Usage:
   docker compose -f docker-compose.e2e.yml ps
 
   # Run tests
-  pip install requests pytest
+  pip install -r e2e/requirements.txt
   python e2e/test_platform.py
 
-  # Or with pytest
+  # Or with pytest (add --log-cli-level=INFO to see per-test diagnostics)
   pytest e2e/test_platform.py -v
 
+  # Or in parallel with pytest-xdist (each worker keeps whole test classes
+  # together and waits for service health once before its first class)
+  pytest e2e/test_platform.py -n 4 --dist=loadscope
+
+  # The same from the plain entry point (worker count or "auto")
+  E2E_PARALLEL=auto python e2e/test_platform.py
+
+  # Rerunning the suite in one long-lived interpreter skips the health
+  # wait for services seen healthy within HEALTH_CACHE_TTL seconds
+  # (default 10; 0 always waits). A normal run waits once per process, so
+  # this only affects REPL or embedded-runner reruns.
+
+  # Or check that the suite runs without the stack (canned in-process
+  # responses, no network). This verifies no service contract, and the
+  # AI capability tests and matching flow are skipped
+  AURA_E2E_MOCK=1 python e2e/test_platform.py
+
   # Cleanup
   docker compose -f docker-compose.e2e.yml down -v
 """
 
 import os
+import atexit
 import sys
 import time
 import json
+import random
+import threading
 import base64
+import logging
+import logging.handlers
 import requests
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import urllib3
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Tuple, Collection
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 import unittest
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class ServiceConfig:
     """Configuration for a service endpoint"""
     name: str
     url: str
     health_endpoint: str = "/health"
+    health_url: str = field(init=False)
+
+    def __post_init__(self):
+        # Built once here rather than on every health probe
+        object.__setattr__(self, "health_url", f"{self.url}{self.health_endpoint}")
+
+@dataclass
+class EndpointProbe:
+    """A status-code check against a single endpoint"""
+    name: str
+    method: str
+    path: str
+    allowed: Collection[int]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
 
 SERVICES = {
     "aura-app": ServiceConfig("AURA Main App", os.getenv("AURA_APP_URL", "http://localhost:8080"), "/actuator/health"),
@@ -60,126 +101,592 @@ SERVICES = {
     "ai-service": ServiceConfig("AI Service", os.getenv("AI_SERVICE_URL", "http://localhost:8002")),
 }
 
+# Per-test diagnostics; shown by main(), or under pytest with --log-cli-level=INFO
+LOG = logging.getLogger("e2e")
+
+# Diagnostic lines main() holds before writing them out
+LOG_BUFFER_CAPACITY = 10000
+
 # Test timeouts
 HEALTH_CHECK_TIMEOUT = 120  # seconds
-REQUEST_TIMEOUT = 30  # seconds
+# Services are already up when tests run, so a slow connect means something
+# is wrong and fails fast; reads keep room for model inference
+REQUEST_CONNECT_TIMEOUT = 2  # seconds
+REQUEST_READ_TIMEOUT = 30  # seconds
+REQUEST_TIMEOUT = (REQUEST_CONNECT_TIMEOUT, REQUEST_READ_TIMEOUT)
+
+# Status-code-only probes answer from a controller or security filter with
+# no heavy work behind them, so a hung endpoint is cut off much sooner
+PROBE_READ_TIMEOUT = 5  # seconds
+PROBE_TIMEOUT = (REQUEST_CONNECT_TIMEOUT, PROBE_READ_TIMEOUT)
+
+# Health polling backoff: start fast so ready services are seen quickly,
+# then back off so slow starters are not hammered
+HEALTH_POLL_INITIAL_DELAY = 0.05  # seconds
+HEALTH_POLL_MAX_DELAY = 2.0  # seconds
+HEALTH_PROBE_CONNECT_TIMEOUT = 0.5  # seconds; a closed port fails fast
+HEALTH_PROBE_INITIAL_TIMEOUT = 1.0  # seconds, read
+HEALTH_PROBE_MAX_TIMEOUT = 2.0  # seconds, read
+HEALTH_PROBE_MIN_TIMEOUT = 0.1  # seconds; less budget than this is not worth a probe
+
+# How long a successful health wait is trusted before probing again. A test
+# run waits once per process from setUpModule, so this only matters when
+# the suite is run repeatedly in one long-lived interpreter (a REPL or an
+# embedding runner), where it skips only the readiness poll; the health
+# tests still send their own requests. 0 disables it.
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "10"))  # seconds
+
+# Sent by every session so service logs can tell e2e traffic apart
+E2E_USER_AGENT = "aura-e2e/1.0"
+
+# Keep-alive connections held per host by each session
+SESSION_POOL_SIZE = 16
+
+# Concurrent requests per prefetch batch; matching the pool size lets a
+# whole survey such as TestCoreDatingFlows go out in one or two waves
+# without opening connections the pool would then discard
+PROBE_WORKERS = SESSION_POOL_SIZE
+
+# AURA_E2E_MOCK=1 answers requests in-process with canned responses. It only
+# checks that the suite runs without the docker stack, not any service
+# contract; the AI capability tests are skipped in this mode.
+MOCK_MODE = os.getenv("AURA_E2E_MOCK") == "1"
+
+
+# =============================================================================
+# Mock Mode
+# =============================================================================
+
+class MockServiceAdapter(BaseAdapter):
+    """Transport adapter that answers for the configured services offline
+
+    Only health checks, the aura-app security filter and the media routes
+    are answered, with payloads taken from those services. The AI service
+    answers nothing but /health: the suite's AI calls do not match its
+    routes, so those tests are skipped in mock mode rather than faked.
+    """
+
+    # Pages the app serves without a login
+    AURA_PUBLIC_PATHS = {"/", "/login", "/register", "/captcha/generate", "/password/reset"}
+
+    def __init__(self):
+        super().__init__()
+        self.hosts = {urlsplit(service.url).netloc: key for key, service in SERVICES.items()}
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        service = self.hosts.get(url.netloc)
+        if service == "aura-app":
+            status, data = self.aura_app(request.method, url.path)
+        elif service == "media-service":
+            status, data = self.media_service(request.method, url.path, request.body)
+        elif service == "ai-service":
+            status, data = self.ai_service(request.method, url.path, request.body)
+        else:
+            raise requests.exceptions.ConnectionError(f"No mock for {request.url}", request=request)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers["Content-Type"] = "application/json"
+        response._content = b"" if request.method == "HEAD" else json.dumps(data).encode()
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+    def aura_app(self, method: str, path: str) -> Tuple[int, Any]:
+        if path == "/actuator/health":
+            return 200, {"status": "UP", "components": {"db": {"status": "UP"}}}
+        if method in ("GET", "HEAD") and path in self.AURA_PUBLIC_PATHS:
+            return 200, {}
+        if path == "/actuator/info":
+            return 404, {}
+        if method == "POST" and path == "/api/v1/waitlist/signup":
+            return 200, {}
+        # Everything else sits behind login
+        return 401, {"error": "unauthorized"}
+
+    def media_service(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        if path == "/health":
+            return 200, {"status": "healthy", "service": "media-service"}
+        if path == "/verify/liveness/challenges":
+            challenges = [
+                {"type": "BLINK", "instruction": "Please blink naturally 2-3 times"},
+                {"type": "SMILE", "instruction": "Please smile naturally"},
+                {"type": "TURN_HEAD_LEFT", "instruction": "Turn your head slightly to the left"},
+            ]
+            return 200, {"session_id": "mock-session", "challenges": challenges,
+                         "timeout": 30, "total_timeout": 120}
+        if path == "/upload/video":
+            return 200, {"url": "/media/mock.mp4", "filename": "mock.mp4", "size": len(body or b"")}
+        if path == "/verify/face":
+            return 200, {"verified": False, "face_match_score": 0.0, "liveness_score": 0.0,
+                         "deepfake_score": 1.0, "issues": ["Could not load profile image"]}
+        return 404, {"detail": "Not Found"}
+
+    def ai_service(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        if path == "/health":
+            return 200, {"status": "healthy", "service": "ai-matching-service"}
+        return 404, {"detail": "Not Found"}
+
+
+# =============================================================================
+# HTTP Sessions
+# =============================================================================
+
+def create_session() -> requests.Session:
+    """Create a keep-alive session pooled for concurrent requests"""
+    session = requests.Session()
+    # requests already sends keep-alive and gzip/deflate by default; the
+    # agent just makes e2e traffic easy to pick out in service logs
+    session.headers["User-Agent"] = E2E_USER_AGENT
+    # Idempotent requests get a couple of quick retries on gateway errors
+    # while a container is still settling; the last response is still
+    # returned so tests assert on it as before. Connect and read failures
+    # are not retried, so a hung endpoint costs one timeout, not three.
+    retries = Retry(total=2, connect=0, read=0, backoff_factor=0.1,
+                    status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=SESSION_POOL_SIZE, max_retries=retries)
+    if MOCK_MODE:
+        adapter = MockServiceAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all tests so repeated calls to the same hosts reuse connections
+SESSION = create_session()
+
+# Health polling only needs a status code, so it skips the requests layer
+# and uses its own urllib3 pool; failed probes never touch SESSION
+HEALTH_POOL = urllib3.PoolManager(num_pools=len(SERVICES), maxsize=2, retries=False)
+
+# Close pooled keep-alive connections on exit so the services see a clean
+# disconnect; covers main(), pytest and xdist workers alike
+atexit.register(SESSION.close)
+atexit.register(HEALTH_POOL.clear)
+
+# Health pollers run on worker threads; one status line at a time
+_PRINT_LOCK = threading.Lock()
 
 
 # =============================================================================
 # Test Utilities
 # =============================================================================
 
+# Monotonic time each health URL was last seen healthy
+_healthy_since: Dict[str, float] = {}
+
+# Health URLs that refused HEAD and are polled with GET instead
+_no_head: set = set()
+
+
 def wait_for_service(service: ServiceConfig, timeout: int = HEALTH_CHECK_TIMEOUT) -> bool:
-    """Wait for a service to become healthy"""
-    start_time = time.time()
-    url = f"{service.url}{service.health_endpoint}"
+    """Wait for a service to become healthy
 
-    while time.time() - start_time < timeout:
+    A service seen healthy within HEALTH_CACHE_TTL seconds is not polled
+    again; only this readiness wait is skipped, as TestServiceHealth still
+    fetches a fresh health response on every run.
+    """
+    seen = _healthy_since.get(service.health_url)
+    if seen is not None and time.monotonic() - seen < HEALTH_CACHE_TTL:
+        return True
+
+    # Probe and sleep durations are clipped to one shared deadline, so the
+    # wait gives up close to `timeout` rather than a full probe past it
+    deadline = time.monotonic() + timeout
+    delay = HEALTH_POLL_INITIAL_DELAY
+    probe_timeout = HEALTH_PROBE_INITIAL_TIMEOUT
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= HEALTH_PROBE_MIN_TIMEOUT:
+            break
         try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                print(f"  [OK] {service.name} is healthy")
+            # HEAD skips the body entirely; services whose health route
+            # only answers GET are remembered and polled with GET
+            method = "GET" if service.health_url in _no_head else "HEAD"
+            response = HEALTH_POOL.request(
+                method, service.health_url, preload_content=False,
+                timeout=urllib3.Timeout(connect=min(HEALTH_PROBE_CONNECT_TIMEOUT, remaining),
+                                        read=min(probe_timeout, remaining)))
+            healthy = response.status == 200
+            # Only the status line matters: discard the body undecoded and
+            # hand the connection back for the next probe
+            response.drain_conn()
+            response.release_conn()
+            if method == "HEAD" and response.status in (405, 501):
+                _no_head.add(service.health_url)
+                continue
+            if healthy:
+                _healthy_since[service.health_url] = time.monotonic()
+                with _PRINT_LOCK:
+                    print(f"  [OK] {service.name} is healthy")
                 return True
-        except requests.exceptions.RequestException:
-            pass
-        time.sleep(2)
-
-    print(f"  [FAIL] {service.name} not healthy after {timeout}s")
+        except urllib3.exceptions.NewConnectionError:
+            LOG.debug("%s: connection refused", service.name)
+        except urllib3.exceptions.TimeoutError:
+            LOG.debug("%s: health probe timed out", service.name)
+        except urllib3.exceptions.HTTPError as e:
+            LOG.debug("%s: health probe failed: %s", service.name, e)
+        # Jitter keeps concurrent pollers from probing in lockstep; it scales
+        # with the delay so the first retries stay short
+        time.sleep(max(0.0, min(delay * random.uniform(1.0, 1.5), deadline - time.monotonic())))
+        delay = min(HEALTH_POLL_MAX_DELAY, delay * 1.5)
+        probe_timeout = min(HEALTH_PROBE_MAX_TIMEOUT, probe_timeout * 1.5)
+
+    with _PRINT_LOCK:
+        print(f"  [FAIL] {service.name} not healthy after {timeout}s")
     return False
 
 
 def wait_for_all_services() -> bool:
-    """Wait for all services to become healthy"""
+    """Wait for all services to become healthy (polled concurrently)"""
     print("\n" + "=" * 60)
     print("Waiting for services to become healthy...")
     print("=" * 60)
 
+    # Each poll is I/O bound, so waiting on all services at once bounds the
+    # total wait by the slowest service instead of the sum of all of them.
     all_healthy = True
-    for key, service in SERVICES.items():
-        if not wait_for_service(service):
-            all_healthy = False
+    with ThreadPoolExecutor(max_workers=len(SERVICES)) as executor:
+        futures = [executor.submit(wait_for_service, service) for service in SERVICES.values()]
+        for future in as_completed(futures):
+            if not future.result():
+                all_healthy = False
 
     return all_healthy
 
 
+# Health responses by service key, fetched at most once per run; setUpModule
+# clears it so a rerun in the same interpreter fetches fresh ones
+_health_responses: Dict[str, Any] = {}
+
+
+def response_or_raise(result: Any) -> requests.Response:
+    """Return a fetched response, re-raising the request error stored in its place"""
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def fetch_health(key: str) -> Any:
+    """Fetch a service's health endpoint once, caching the response or request error"""
+    if key not in _health_responses:
+        try:
+            _health_responses[key] = SESSION.get(SERVICES[key].health_url, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            _health_responses[key] = e
+    return _health_responses[key]
+
+
+def get_health_response(key: str) -> requests.Response:
+    """Return a service's cached health response
+
+    A request error is re-raised for this service only, so one unreachable
+    service does not fail the others' health checks.
+    """
+    return response_or_raise(fetch_health(key))
+
+
+def fetch_all(session: requests.Session, base_url: str, calls: List[Tuple[str, str, Dict[str, Any]]],
+              timeout: Tuple[float, float] = REQUEST_TIMEOUT) -> Dict[tuple, Any]:
+    """Issue independent (method, path, kwargs) requests concurrently, keyed by (method, path)
+
+    Request errors are returned in place of the response so each call can
+    still report its own failure; see response_or_raise.
+    """
+    def fetch(call):
+        method, path, kwargs = call
+        try:
+            return session.request(method, f"{base_url}{path}", timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+        results = executor.map(fetch, calls)
+    return {(method, path): result for (method, path, _), result in zip(calls, results)}
+
+
+class ServiceTestMixin:
+    """Resolves base_url for the service a test class exercises
+
+    Subclasses name the service key in SERVICE and may add a BASE_PATH
+    under its URL.
+    """
+
+    SERVICE = "aura-app"
+    BASE_PATH = ""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_url = f"{SERVICES[cls.SERVICE].url}{cls.BASE_PATH}"
+
+
+class EndpointProbeMixin(ServiceTestMixin):
+    """Status-code checks for a table of independent AURA app endpoints
+
+    Subclasses list their endpoints in PROBES, relative to BASE_PATH under
+    the app URL. Every probe is fetched up front in one concurrent batch on
+    the shared SESSION and checked in a single test, one subTest per
+    endpoint. The probes are anonymous and stateless, so classes share its
+    warm connections rather than each opening their own.
+    """
+
+    PROBES: List[EndpointProbe] = []
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        calls = [(probe.method, probe.path, probe.kwargs) for probe in cls.PROBES]
+        cls.responses = fetch_all(SESSION, cls.base_url, calls, timeout=PROBE_TIMEOUT)
+
+    def test_endpoint_probes(self):
+        """Test every probed endpoint responds with an expected status"""
+        for probe in self.PROBES:
+            with self.subTest(probe.name):
+                response = response_or_raise(self.responses[(probe.method, probe.path)])
+                self.assertIn(response.status_code, probe.allowed)
+                LOG.info("    %s: Status %s", probe.name, response.status_code)
+
+
+# =============================================================================
+# Test Data
+# =============================================================================
+
+# Accepted statuses for public pages, which may redirect
+PUBLIC_PAGE = frozenset({200, 302})
+
+# Accepted statuses for endpoints behind login, which anonymous e2e
+# requests may also see redirected or refused
+AUTH_REQUIRED = frozenset({200, 302, 401, 403})
+
+# As above, for endpoints addressing a resource that may not exist
+RESOURCE_LOOKUP = frozenset({200, 302, 400, 401, 403, 404})
+
+# As above, for endpoints that reject missing or invalid input with 400
+INPUT_REQUIRED = frozenset({200, 302, 400, 401, 403})
+
+# As above, for endpoints that may not be deployed in every configuration
+OPTIONAL_FEATURE = frozenset({200, 302, 401, 403, 404})
+
+# Well-formed UUID that matches no user, for endpoints that should fail gracefully
+FAKE_UUID = "00000000-0000-0000-0000-000000000001"
+
+# Profiles are shared across tests and must not be mutated
+
+# Compatibility pair for TestAIServiceCapabilities
+PROFILE_USER1 = {
+    "user_id": 1,
+    "personality": {
+        "openness": 75,
+        "conscientiousness": 60,
+        "extraversion": 65,
+        "agreeableness": 80,
+        "neuroticism": 35
+    },
+    "values": {
+        "progressive": 70,
+        "egalitarian": 75
+    },
+    "lifestyle": {
+        "social": 60,
+        "health": 70,
+        "work_life": 55,
+        "finance": 65
+    },
+    "attachment": {
+        "anxiety": 25,
+        "avoidance": 20
+    }
+}
+
+PROFILE_USER2 = {
+    "user_id": 2,
+    "personality": {
+        "openness": 70,
+        "conscientiousness": 65,
+        "extraversion": 55,
+        "agreeableness": 75,
+        "neuroticism": 40
+    },
+    "values": {
+        "progressive": 65,
+        "egalitarian": 80
+    },
+    "lifestyle": {
+        "social": 55,
+        "health": 75,
+        "work_life": 60,
+        "finance": 60
+    },
+    "attachment": {
+        "anxiety": 30,
+        "avoidance": 25
+    }
+}
+
+# Batch matching target
+PROFILE_TARGET = {
+    "user_id": 1,
+    "personality": {"openness": 70, "conscientiousness": 65, "extraversion": 60, "agreeableness": 75, "neuroticism": 35},
+    "values": {"progressive": 70, "egalitarian": 75},
+    "lifestyle": {"social": 60, "health": 70, "work_life": 55, "finance": 65},
+    "attachment": {"anxiety": 25, "avoidance": 20}
+}
+
+# Batch matching candidates with gradually diverging traits
+BATCH_CANDIDATES = [
+    {
+        "user_id": i,
+        "personality": {"openness": 50 + i*5, "conscientiousness": 60, "extraversion": 55, "agreeableness": 70, "neuroticism": 40},
+        "values": {"progressive": 60 + i*3, "egalitarian": 70},
+        "lifestyle": {"social": 55, "health": 65, "work_life": 50, "finance": 60},
+        "attachment": {"anxiety": 30, "avoidance": 25}
+    }
+    for i in range(2, 7)
+]
+
+# Embedding generation uses user 1's traits under its own id
+PROFILE_EMBEDDING = {**PROFILE_USER1, "user_id": 100}
+
+# End-to-end matching flow: a seeker, a compatible and an incompatible candidate
+PROFILE_SEEKER = {
+    "user_id": 1001,
+    "personality": {"openness": 80, "conscientiousness": 70, "extraversion": 65, "agreeableness": 85, "neuroticism": 30},
+    "values": {"progressive": 75, "egalitarian": 80},
+    "lifestyle": {"social": 65, "health": 75, "work_life": 60, "finance": 70},
+    "attachment": {"anxiety": 20, "avoidance": 15}
+}
+
+PROFILE_COMPATIBLE = {
+    "user_id": 1002,
+    "personality": {"openness": 75, "conscientiousness": 75, "extraversion": 60, "agreeableness": 80, "neuroticism": 35},
+    "values": {"progressive": 70, "egalitarian": 85},
+    "lifestyle": {"social": 60, "health": 80, "work_life": 65, "finance": 65},
+    "attachment": {"anxiety": 25, "avoidance": 20}
+}
+
+PROFILE_INCOMPATIBLE = {
+    "user_id": 1003,
+    "personality": {"openness": 40, "conscientiousness": 50, "extraversion": 80, "agreeableness": 50, "neuroticism": 60},
+    "values": {"progressive": 30, "egalitarian": 40},
+    "lifestyle": {"social": 90, "health": 30, "work_life": 40, "finance": 45},
+    "attachment": {"anxiety": 60, "avoidance": 50}
+}
+
+# Fixed JSON request bodies, serialized once at import
+JSON_HEADERS = {"Content-Type": "application/json"}
+LIVENESS_BODY = json.dumps({"user_id": 12345}).encode()
+COMPATIBILITY_BODY = json.dumps({"user1": PROFILE_USER1, "user2": PROFILE_USER2}).encode()
+BATCH_MATCHING_BODY = json.dumps(
+    {"target": PROFILE_TARGET, "candidates": BATCH_CANDIDATES, "limit": 5}
+).encode()
+EMBEDDING_BODY = json.dumps({"profile": PROFILE_EMBEDDING}).encode()
+
+# End-to-end matching flow in TestIntegrationScenarios
+SEEKER_EMBEDDING_BODY = json.dumps({"profile": PROFILE_SEEKER}).encode()
+COMPATIBLE_EMBEDDING_BODY = json.dumps({"profile": PROFILE_COMPATIBLE}).encode()
+SEEKER_MATCHING_BODY = json.dumps(
+    {"target": PROFILE_SEEKER, "candidates": [PROFILE_COMPATIBLE, PROFILE_INCOMPATIBLE], "limit": 2}
+).encode()
+
+# Create a minimal valid PNG (1x1 red pixel)
+# This is a valid PNG that services can process
+_TEST_PNG_BYTES = bytes([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
+    0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
+    0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,  # 1x1 dimensions
+    0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
+    0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
+    0x54, 0x08, 0xD7, 0x63, 0xF8, 0xCF, 0xC0, 0x00,
+    0x00, 0x00, 0x03, 0x00, 0x01, 0x00, 0x05, 0xFE,
+    0xD4, 0xEF, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45,  # IEND chunk
+    0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
+])
+
+# Fake video bytes for testing
+_TEST_VIDEO_BYTES = b"FAKE_VIDEO_DATA_FOR_TESTING"
+
+
 def generate_test_image(width: int = 640, height: int = 480) -> bytes:
-    """Generate a simple test image (PNG format)"""
-    # Create a minimal valid PNG (1x1 red pixel)
-    # This is a valid PNG that services can process
-    png_header = bytes([
-        0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-        0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-        0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,  # 1x1 dimensions
-        0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-        0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
-        0x54, 0x08, 0xD7, 0x63, 0xF8, 0xCF, 0xC0, 0x00,
-        0x00, 0x00, 0x03, 0x00, 0x01, 0x00, 0x05, 0xFE,
-        0xD4, 0xEF, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45,  # IEND chunk
-        0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
-    ])
-    return png_header
+    """Generate a simple test image (PNG format)
+
+    Always returns the same 1x1 PNG; width and height are accepted for
+    call-site compatibility but ignored.
+    """
+    return _TEST_PNG_BYTES
 
 
 def generate_test_video() -> bytes:
     """Generate minimal test video data"""
-    # Return fake video bytes for testing
-    return b"FAKE_VIDEO_DATA_FOR_TESTING"
+    return _TEST_VIDEO_BYTES
 
 
 # =============================================================================
 # Test Classes
 # =============================================================================
 
+def setUpModule():
+    """Wait for all services once before any test class runs"""
+    _health_responses.clear()
+    if MOCK_MODE:
+        print("\nAURA_E2E_MOCK=1: answering requests in-process, not waiting for services")
+        return
+    if not wait_for_all_services():
+        raise Exception("Not all services are healthy")
+
+
 class TestServiceHealth(unittest.TestCase):
     """Test that all services are healthy and responding"""
 
     @classmethod
     def setUpClass(cls):
-        """Wait for all services before running tests"""
-        if not wait_for_all_services():
-            raise Exception("Not all services are healthy")
+        # Fetch every service's health response at once; the tests below
+        # (and the later database check) read them from the cache
+        with ThreadPoolExecutor(max_workers=len(SERVICES)) as executor:
+            list(executor.map(fetch_health, SERVICES))
 
     def test_aura_app_health(self):
         """Test AURA main application health endpoint"""
-        service = SERVICES["aura-app"]
-        response = requests.get(f"{service.url}/actuator/health", timeout=REQUEST_TIMEOUT)
+        response = get_health_response("aura-app")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertIn("status", data)
-        print(f"    AURA App Status: {data.get('status', 'unknown')}")
+        LOG.info("    AURA App Status: %s", data.get('status', 'unknown'))
 
     def test_media_service_health(self):
         """Test Media Service health endpoint"""
-        service = SERVICES["media-service"]
-        response = requests.get(f"{service.url}/health", timeout=REQUEST_TIMEOUT)
+        response = get_health_response("media-service")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data.get("status"), "healthy")
         self.assertEqual(data.get("service"), "media-service")
-        print(f"    Media Service: {data}")
+        LOG.info("    Media Service: %s", data)
 
     def test_ai_service_health(self):
         """Test AI Service health endpoint"""
-        service = SERVICES["ai-service"]
-        response = requests.get(f"{service.url}/health", timeout=REQUEST_TIMEOUT)
+        response = get_health_response("ai-service")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data.get("status"), "healthy")
-        print(f"    AI Service: {data}")
+        LOG.info("    AI Service: %s", data)
 
 
-class TestMediaServiceCapabilities(unittest.TestCase):
+class TestMediaServiceCapabilities(ServiceTestMixin, unittest.TestCase):
     """Test Media Service face verification and video analysis capabilities"""
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES["media-service"].url
+    SERVICE = "media-service"
 
     def test_liveness_challenges(self):
         """Test that liveness challenge generation works"""
-        response = requests.post(
+        response = SESSION.post(
             f"{self.base_url}/verify/liveness/challenges",
-            json={"user_id": 12345},
+            data=LIVENESS_BODY,
+            headers=JSON_HEADERS,
             timeout=REQUEST_TIMEOUT
         )
         self.assertEqual(response.status_code, 200)
@@ -194,13 +701,13 @@ class TestMediaServiceCapabilities(unittest.TestCase):
             self.assertIn("type", challenge)
             self.assertIn("instruction", challenge)
 
-        print(f"    Liveness Challenges: {[c['type'] for c in data['challenges']]}")
+        LOG.info("    Liveness Challenges: %s", [c['type'] for c in data['challenges']])
 
     def test_video_upload(self):
         """Test video upload capability"""
         video_data = generate_test_video()
 
-        response = requests.post(
+        response = SESSION.post(
             f"{self.base_url}/upload/video",
             files={"file": ("test_video.mp4", video_data, "video/mp4")},
             data={"path": "e2e-test", "type": "verification"},
@@ -211,12 +718,12 @@ class TestMediaServiceCapabilities(unittest.TestCase):
         self.assertIn("url", data)
         self.assertIn("filename", data)
         self.assertIn("size", data)
-        print(f"    Video Upload: {data['filename']} ({data['size']} bytes)")
+        LOG.info("    Video Upload: %s (%s bytes)", data['filename'], data['size'])
 
     def test_face_verification_endpoint_exists(self):
         """Test that face verification endpoint is accessible"""
         # Test with missing data to verify endpoint exists
-        response = requests.post(
+        response = SESSION.post(
             f"{self.base_url}/verify/face",
             json={
                 "user_id": 12345,
@@ -231,73 +738,35 @@ class TestMediaServiceCapabilities(unittest.TestCase):
         data = response.json()
         self.assertIn("verified", data)
         self.assertFalse(data["verified"])  # Should fail due to missing files
-        print(f"    Face Verification Endpoint: Accessible (returns proper error)")
+        LOG.info("    Face Verification Endpoint: Accessible (returns proper error)")
 
 
-class TestAIServiceCapabilities(unittest.TestCase):
+class TestAIServiceCapabilities(ServiceTestMixin, unittest.TestCase):
     """Test AI Service matching and compatibility capabilities"""
 
+    SERVICE = "ai-service"
+
+    # The three calls are independent, so they are sent concurrently up
+    # front and each test asserts on its own response.
+    CALLS = [
+        ("POST", "/compatibility/score", {"data": COMPATIBILITY_BODY, "headers": JSON_HEADERS}),
+        ("POST", "/matching/batch", {"data": BATCH_MATCHING_BODY, "headers": JSON_HEADERS}),
+        ("POST", "/embedding/generate", {"data": EMBEDDING_BODY, "headers": JSON_HEADERS}),
+    ]
+
     @classmethod
     def setUpClass(cls):
-        cls.base_url = SERVICES["ai-service"].url
+        super().setUpClass()
+        cls.responses = fetch_all(SESSION, cls.base_url, cls.CALLS)
 
+    def get_response(self, path: str) -> requests.Response:
+        """Return the prefetched response for a POST path, re-raising request errors"""
+        return response_or_raise(self.responses[("POST", path)])
+
+    @unittest.skipIf(MOCK_MODE, "AI routes are not mocked")
     def test_compatibility_scoring(self):
         """Test compatibility score calculation between two profiles"""
-        user1_profile = {
-            "user_id": 1,
-            "personality": {
-                "openness": 75,
-                "conscientiousness": 60,
-                "extraversion": 65,
-                "agreeableness": 80,
-                "neuroticism": 35
-            },
-            "values": {
-                "progressive": 70,
-                "egalitarian": 75
-            },
-            "lifestyle": {
-                "social": 60,
-                "health": 70,
-                "work_life": 55,
-                "finance": 65
-            },
-            "attachment": {
-                "anxiety": 25,
-                "avoidance": 20
-            }
-        }
-
-        user2_profile = {
-            "user_id": 2,
-            "personality": {
-                "openness": 70,
-                "conscientiousness": 65,
-                "extraversion": 55,
-                "agreeableness": 75,
-                "neuroticism": 40
-            },
-            "values": {
-                "progressive": 65,
-                "egalitarian": 80
-            },
-            "lifestyle": {
-                "social": 55,
-                "health": 75,
-                "work_life": 60,
-                "finance": 60
-            },
-            "attachment": {
-                "anxiety": 30,
-                "avoidance": 25
-            }
-        }
-
-        response = requests.post(
-            f"{self.base_url}/compatibility/score",
-            json={"user1": user1_profile, "user2": user2_profile},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = self.get_response("/compatibility/score")
         self.assertEqual(response.status_code, 200)
         data = response.json()
 
@@ -308,35 +777,13 @@ class TestAIServiceCapabilities(unittest.TestCase):
         self.assertGreaterEqual(score, 0)
         self.assertLessEqual(score, 100)
 
-        print(f"    Compatibility Score: {score:.1f}%")
-        print(f"    Category Breakdown: {data['category_scores']}")
+        LOG.info("    Compatibility Score: %.1f%%", score)
+        LOG.info("    Category Breakdown: %s", data['category_scores'])
 
+    @unittest.skipIf(MOCK_MODE, "AI routes are not mocked")
     def test_batch_matching(self):
         """Test batch matching capability"""
-        target_user = {
-            "user_id": 1,
-            "personality": {"openness": 70, "conscientiousness": 65, "extraversion": 60, "agreeableness": 75, "neuroticism": 35},
-            "values": {"progressive": 70, "egalitarian": 75},
-            "lifestyle": {"social": 60, "health": 70, "work_life": 55, "finance": 65},
-            "attachment": {"anxiety": 25, "avoidance": 20}
-        }
-
-        candidates = [
-            {
-                "user_id": i,
-                "personality": {"openness": 50 + i*5, "conscientiousness": 60, "extraversion": 55, "agreeableness": 70, "neuroticism": 40},
-                "values": {"progressive": 60 + i*3, "egalitarian": 70},
-                "lifestyle": {"social": 55, "health": 65, "work_life": 50, "finance": 60},
-                "attachment": {"anxiety": 30, "avoidance": 25}
-            }
-            for i in range(2, 7)
-        ]
-
-        response = requests.post(
-            f"{self.base_url}/matching/batch",
-            json={"target": target_user, "candidates": candidates, "limit": 5},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = self.get_response("/matching/batch")
         self.assertEqual(response.status_code, 200)
         data = response.json()
 
@@ -348,25 +795,14 @@ class TestAIServiceCapabilities(unittest.TestCase):
             scores = [m["score"] for m in data["matches"]]
             self.assertEqual(scores, sorted(scores, reverse=True))
 
-        print(f"    Batch Matching: Found {len(data['matches'])} matches")
+        LOG.info("    Batch Matching: Found %s matches", len(data['matches']))
         for match in data["matches"][:3]:
-            print(f"      User {match['user_id']}: {match['score']:.1f}%")
+            LOG.info("      User %s: %.1f%%", match['user_id'], match['score'])
 
+    @unittest.skipIf(MOCK_MODE, "AI routes are not mocked")
     def test_embedding_generation(self):
         """Test profile embedding generation"""
-        profile = {
-            "user_id": 100,
-            "personality": {"openness": 75, "conscientiousness": 60, "extraversion": 65, "agreeableness": 80, "neuroticism": 35},
-            "values": {"progressive": 70, "egalitarian": 75},
-            "lifestyle": {"social": 60, "health": 70, "work_life": 55, "finance": 65},
-            "attachment": {"anxiety": 25, "avoidance": 20}
-        }
-
-        response = requests.post(
-            f"{self.base_url}/embedding/generate",
-            json={"profile": profile},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = self.get_response("/embedding/generate")
         self.assertEqual(response.status_code, 200)
         data = response.json()
 
@@ -375,22 +811,18 @@ class TestAIServiceCapabilities(unittest.TestCase):
         self.assertIsInstance(data["embedding"], list)
         self.assertEqual(len(data["embedding"]), data["dimension"])
 
-        print(f"    Embedding: {data['dimension']}-dimensional vector generated")
+        LOG.info("    Embedding: %s-dimensional vector generated", data['dimension'])
 
 
-class TestAuraAppCapabilities(unittest.TestCase):
+class TestAuraAppCapabilities(ServiceTestMixin, unittest.TestCase):
     """Test AURA main application capabilities"""
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES["aura-app"].url
-
     def test_actuator_info(self):
         """Test actuator info endpoint"""
-        response = requests.get(f"{self.base_url}/actuator/info", timeout=REQUEST_TIMEOUT)
+        response = SESSION.get(f"{self.base_url}/actuator/info", timeout=PROBE_TIMEOUT)
         # May return 200 or 404 depending on actuator config
         self.assertIn(response.status_code, [200, 404])
-        print(f"    Actuator Info: Status {response.status_code}")
+        LOG.info("    Actuator Info: Status %s", response.status_code)
 
     def test_api_documentation_accessible(self):
         """Test that API documentation is accessible (if enabled)"""
@@ -398,22 +830,32 @@ class TestAuraAppCapabilities(unittest.TestCase):
         endpoints = ["/swagger-ui.html", "/v3/api-docs", "/swagger-ui/index.html"]
         accessible = False
 
-        for endpoint in endpoints:
+        def probe(endpoint):
             try:
-                response = requests.get(f"{self.base_url}{endpoint}", timeout=5, allow_redirects=True)
-                if response.status_code == 200:
+                response = SESSION.get(f"{self.base_url}{endpoint}", timeout=PROBE_TIMEOUT, allow_redirects=True)
+                return response.status_code == 200
+            except requests.exceptions.RequestException:
+                return False
+
+        # Probe all candidates at once and take the first that answers, so a
+        # missing docs setup costs one timeout window instead of three
+        executor = ThreadPoolExecutor(max_workers=len(endpoints))
+        try:
+            futures = {executor.submit(probe, endpoint): endpoint for endpoint in endpoints}
+            for future in as_completed(futures):
+                if future.result():
                     accessible = True
-                    print(f"    API Docs: {endpoint} accessible")
+                    LOG.info("    API Docs: %s accessible", futures[future])
                     break
-            except:
-                pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # API docs may not be enabled in all profiles
-        print(f"    API Documentation: {'Accessible' if accessible else 'Not configured'}")
+        LOG.info("    API Documentation: %s", 'Accessible' if accessible else 'Not configured')
 
     def test_database_connectivity_via_health(self):
         """Test database connectivity through health endpoint"""
-        response = requests.get(f"{self.base_url}/actuator/health", timeout=REQUEST_TIMEOUT)
+        response = get_health_response("aura-app")
         self.assertEqual(response.status_code, 200)
         data = response.json()
 
@@ -421,9 +863,9 @@ class TestAuraAppCapabilities(unittest.TestCase):
         if "components" in data and "db" in data["components"]:
             db_status = data["components"]["db"]["status"]
             self.assertEqual(db_status, "UP")
-            print(f"    Database: {db_status}")
+            LOG.info("    Database: %s", db_status)
         else:
-            print("    Database: Health details not exposed (security config)")
+            LOG.info("    Database: Health details not exposed (security config)")
 
 
 class TestUIUserJourney(unittest.TestCase):
@@ -443,9 +885,13 @@ class TestUIUserJourney(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.base_url = SERVICES["aura-app"].url
-        cls.session = requests.Session()
+        cls.session = create_session()
         cls.test_email = f"e2e_test_{int(time.time())}@test.alovoa.com"
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
     # =========================================================
     # STAGE 1: PUBLIC PAGES (No Auth Required)
     # UI: index.html, login.html - User lands on homepage
@@ -453,33 +899,33 @@ class TestUIUserJourney(unittest.TestCase):
 
     def test_01_homepage_accessible(self):
         """UI: User visits homepage (index.html)"""
-        response = self.session.get(f"{self.base_url}/", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Homepage: Status {response.status_code}")
+        response = self.session.get(f"{self.base_url}/", timeout=PROBE_TIMEOUT)
+        self.assertIn(response.status_code, PUBLIC_PAGE)
+        LOG.info("    Homepage: Status %s", response.status_code)
 
     def test_02_login_page_renders(self):
         """UI: User clicks 'Login' button (login.html)"""
-        response = self.session.get(f"{self.base_url}/login", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Login Page: Status {response.status_code}")
+        response = self.session.get(f"{self.base_url}/login", timeout=PROBE_TIMEOUT)
+        self.assertIn(response.status_code, PUBLIC_PAGE)
+        LOG.info("    Login Page: Status %s", response.status_code)
 
     def test_03_register_page_accessible(self):
         """UI: User clicks 'Register' button"""
-        response = self.session.get(f"{self.base_url}/register", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Register Page: Status {response.status_code}")
+        response = self.session.get(f"{self.base_url}/register", timeout=PROBE_TIMEOUT)
+        self.assertIn(response.status_code, PUBLIC_PAGE)
+        LOG.info("    Register Page: Status %s", response.status_code)
 
     def test_04_captcha_for_registration(self):
         """UI: Registration form loads captcha (fetch /captcha/generate)"""
-        response = self.session.get(f"{self.base_url}/captcha/generate", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Captcha Generate: Status {response.status_code}")
+        response = self.session.get(f"{self.base_url}/captcha/generate", timeout=PROBE_TIMEOUT)
+        self.assertIn(response.status_code, PUBLIC_PAGE)
+        LOG.info("    Captcha Generate: Status %s", response.status_code)
 
     def test_05_password_reset_page(self):
         """UI: User clicks 'Forgot Password' link"""
-        response = self.session.get(f"{self.base_url}/password/reset", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Password Reset: Status {response.status_code}")
+        response = self.session.get(f"{self.base_url}/password/reset", timeout=PROBE_TIMEOUT)
+        self.assertIn(response.status_code, PUBLIC_PAGE)
+        LOG.info("    Password Reset: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 2: WAITLIST (Public - No Auth)
@@ -490,22 +936,22 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Waitlist page shows count (GET /api/v1/waitlist/count)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/waitlist/count",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
         # Should be publicly accessible
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Waitlist Count: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Waitlist Count: Status %s", response.status_code)
 
     def test_07_waitlist_signup(self):
         """UI: User signs up for waitlist (POST /api/v1/waitlist/signup)"""
         response = self.session.post(
             f"{self.base_url}/api/v1/waitlist/signup",
             json={"email": self.test_email, "referralCode": ""},
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
         # Should accept signup or return validation error
         self.assertIn(response.status_code, [200, 201, 302, 400, 409])
-        print(f"    Waitlist Signup: Status {response.status_code}")
+        LOG.info("    Waitlist Signup: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 3: INTAKE FLOW (Auth Required)
@@ -516,71 +962,71 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Intake page loads progress (GET /intake/progress)"""
         response = self.session.get(
             f"{self.base_url}/intake/progress",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
+        self.assertIn(response.status_code, AUTH_REQUIRED)
         if response.status_code == 200:
             data = response.json()
             # UI expects: progress, encouragement, platformStats
             self.assertIn("progress", data) if isinstance(data, dict) else None
-        print(f"    Intake Progress: Status {response.status_code}")
+        LOG.info("    Intake Progress: Status %s", response.status_code)
 
     def test_09_intake_core_questions(self):
         """UI: Loads 10 core questions (GET /intake/questions)"""
         response = self.session.get(
             f"{self.base_url}/intake/questions",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
+        self.assertIn(response.status_code, AUTH_REQUIRED)
         if response.status_code == 200:
             data = response.json()
             # UI expects: questions array, totalRequired=10, header
             self.assertIn("questions", data) if isinstance(data, dict) else None
-        print(f"    Core Questions: Status {response.status_code}")
+        LOG.info("    Core Questions: Status %s", response.status_code)
 
     def test_10_intake_ai_status(self):
         """UI: Checks AI provider availability (GET /intake/ai/status)"""
         response = self.session.get(
             f"{self.base_url}/intake/ai/status",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
+        self.assertIn(response.status_code, AUTH_REQUIRED)
         if response.status_code == 200:
             data = response.json()
             # UI expects: available (bool), provider (string)
             self.assertIn("available", data) if isinstance(data, dict) else None
-        print(f"    AI Status: Status {response.status_code}")
+        LOG.info("    AI Status: Status %s", response.status_code)
 
     def test_11_intake_video_tips(self):
         """UI: Video recording page loads tips (GET /intake/video/tips)"""
         response = self.session.get(
             f"{self.base_url}/intake/video/tips",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
+        self.assertIn(response.status_code, AUTH_REQUIRED)
         if response.status_code == 200:
             data = response.json()
             # UI expects: header, tips array, funFact, reminder
             self.assertIn("tips", data) if isinstance(data, dict) else None
-        print(f"    Video Tips: Status {response.status_code}")
+        LOG.info("    Video Tips: Status %s", response.status_code)
 
     def test_12_intake_encouragement(self):
         """UI: Gets step-specific encouragement (GET /intake/encouragement/questions)"""
         response = self.session.get(
             f"{self.base_url}/intake/encouragement/questions",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Step Encouragement: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Step Encouragement: Status %s", response.status_code)
 
     def test_13_intake_life_stats(self):
         """UI: Shows personalized life stats (GET /intake/life-stats)"""
         response = self.session.get(
             f"{self.base_url}/intake/life-stats",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Life Stats: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Life Stats: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 4: VIDEO VERIFICATION
@@ -591,19 +1037,19 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Verification page checks status (GET /verification/api/status)"""
         response = self.session.get(
             f"{self.base_url}/verification/api/status",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Verification Status: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Verification Status: Status %s", response.status_code)
 
     def test_15_verification_page_accessible(self):
         """UI: Verification page renders (GET /verification)"""
         response = self.session.get(
             f"{self.base_url}/verification",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Verification Page: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Verification Page: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 5: PROFILE SCAFFOLDING (AI-Inferred Profile)
@@ -614,33 +1060,33 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets video segment prompts (GET /intake/scaffolding/prompts)"""
         response = self.session.get(
             f"{self.base_url}/intake/scaffolding/prompts",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
+        self.assertIn(response.status_code, AUTH_REQUIRED)
         if response.status_code == 200:
             data = response.json()
             # UI expects: prompts array, header with title/subtitle
             self.assertIn("prompts", data) if isinstance(data, dict) else None
-        print(f"    Scaffolding Prompts: Status {response.status_code}")
+        LOG.info("    Scaffolding Prompts: Status %s", response.status_code)
 
     def test_17_scaffolding_progress(self):
         """UI: Checks scaffolding progress (GET /intake/scaffolding/progress)"""
         response = self.session.get(
             f"{self.base_url}/intake/scaffolding/progress",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Scaffolding Progress: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Scaffolding Progress: Status %s", response.status_code)
 
     def test_18_scaffolded_profile(self):
         """UI: Gets AI-scaffolded profile for review (GET /intake/scaffolded-profile)"""
         response = self.session.get(
             f"{self.base_url}/intake/scaffolded-profile",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
         # 400 is expected if no profile exists yet
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Scaffolded Profile: Status {response.status_code}")
+        self.assertIn(response.status_code, INPUT_REQUIRED)
+        LOG.info("    Scaffolded Profile: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 6: PROFILE DETAILS
@@ -651,37 +1097,37 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Loads dropdown options (GET /api/profile/details/options)"""
         response = self.session.get(
             f"{self.base_url}/api/profile/details/options",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profile Options: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Profile Options: Status %s", response.status_code)
 
     def test_20_profile_details_get(self):
         """UI: Loads current profile details (GET /api/profile/details)"""
         response = self.session.get(
             f"{self.base_url}/api/profile/details",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profile Details: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Profile Details: Status %s", response.status_code)
 
     def test_21_profile_visitors(self):
         """UI: Who viewed my profile (GET /api/profile/visitors)"""
         response = self.session.get(
             f"{self.base_url}/api/profile/visitors",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profile Visitors: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Profile Visitors: Status %s", response.status_code)
 
     def test_22_profile_visited(self):
         """UI: Profiles I viewed (GET /api/profile/visited)"""
         response = self.session.get(
             f"{self.base_url}/api/profile/visited",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profiles Visited: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Profiles Visited: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 7: ASSESSMENT & PERSONALITY
@@ -692,46 +1138,46 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets personality questions (GET /personality/assessment)"""
         response = self.session.get(
             f"{self.base_url}/personality/assessment",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Personality Assessment: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Personality Assessment: Status %s", response.status_code)
 
     def test_24_personality_results(self):
         """UI: Shows personality results (GET /personality/results)"""
         response = self.session.get(
             f"{self.base_url}/personality/results",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Personality Results: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Personality Results: Status %s", response.status_code)
 
     def test_25_assessment_progress(self):
         """UI: OKCupid questions progress (GET /assessment/progress)"""
         response = self.session.get(
             f"{self.base_url}/assessment/progress",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Assessment Progress: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Assessment Progress: Status %s", response.status_code)
 
     def test_26_assessment_next_question(self):
         """UI: Gets next unanswered question (GET /assessment/next)"""
         response = self.session.get(
             f"{self.base_url}/assessment/next",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Next Question: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Next Question: Status %s", response.status_code)
 
     def test_27_assessment_batch(self):
         """UI: Gets batch of questions (GET /assessment/batch)"""
         response = self.session.get(
             f"{self.base_url}/assessment/batch",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Question Batch: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Question Batch: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 8: ESSAYS
@@ -742,28 +1188,28 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets essay prompt templates (GET /api/v1/essays/templates)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/essays/templates",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Essay Templates: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Essay Templates: Status %s", response.status_code)
 
     def test_29_essay_list(self):
         """UI: Gets user's essays (GET /api/v1/essays)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/essays",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    User Essays: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    User Essays: Status %s", response.status_code)
 
     def test_30_essay_count(self):
         """UI: Shows essay completion count (GET /api/v1/essays/count)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/essays/count",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Essay Count: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Essay Count: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 9: SEARCH & MATCHING
@@ -774,10 +1220,10 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Default user search (GET /search/users/default)"""
         response = self.session.get(
             f"{self.base_url}/search/users/default",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Search Default: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Search Default: Status %s", response.status_code)
 
     def test_32_search_with_filters(self):
         """UI: Search with filters (POST /api/v1/search/users)"""
@@ -789,40 +1235,39 @@ class TestUIUserJourney(unittest.TestCase):
                 "distance": 50,
                 "page": 0
             },
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Filtered Search: Status {response.status_code}")
+        self.assertIn(response.status_code, INPUT_REQUIRED)
+        LOG.info("    Filtered Search: Status %s", response.status_code)
 
     def test_33_keyword_search(self):
         """UI: Keyword search (POST /api/v1/search/keyword)"""
         response = self.session.post(
             f"{self.base_url}/api/v1/search/keyword",
             json={"keyword": "hiking", "page": 0},
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Keyword Search: Status {response.status_code}")
+        self.assertIn(response.status_code, INPUT_REQUIRED)
+        LOG.info("    Keyword Search: Status %s", response.status_code)
 
     def test_34_daily_matches(self):
         """UI: Gets daily match recommendations (GET /api/v1/matching/daily)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/matching/daily",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Daily Matches: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Daily Matches: Status %s", response.status_code)
 
     def test_35_compatibility_explanation(self):
         """UI: Shows match compatibility (GET /api/v1/matching/compatibility/{uuid})"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
         response = self.session.get(
-            f"{self.base_url}/api/v1/matching/compatibility/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
+            f"{self.base_url}/api/v1/matching/compatibility/{FAKE_UUID}",
+            timeout=PROBE_TIMEOUT
         )
         # 404 expected for fake UUID, but endpoint should be accessible
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Compatibility: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Compatibility: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 10: USER INTERACTIONS (Like, Block, Report)
@@ -831,33 +1276,30 @@ class TestUIUserJourney(unittest.TestCase):
 
     def test_36_like_user(self):
         """UI: Clicks 'Like' button (POST /user/like/{uuid})"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
         response = self.session.post(
-            f"{self.base_url}/user/like/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
+            f"{self.base_url}/user/like/{FAKE_UUID}",
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Like User: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Like User: Status %s", response.status_code)
 
     def test_37_block_user(self):
         """UI: Clicks 'Block' button (POST /user/block/{uuid})"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
         response = self.session.post(
-            f"{self.base_url}/user/block/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
+            f"{self.base_url}/user/block/{FAKE_UUID}",
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Block User: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Block User: Status %s", response.status_code)
 
     def test_38_hide_user(self):
         """UI: Clicks 'Hide' button (POST /user/hide/{uuid})"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
         response = self.session.post(
-            f"{self.base_url}/user/hide/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
+            f"{self.base_url}/user/hide/{FAKE_UUID}",
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Hide User: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Hide User: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 11: MATCH WINDOWS
@@ -868,28 +1310,28 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets pending match windows (GET /api/v1/match-windows/pending)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/match-windows/pending",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Pending Windows: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Pending Windows: Status %s", response.status_code)
 
     def test_40_match_windows_dashboard(self):
         """UI: Match windows dashboard (GET /api/v1/match-windows/dashboard)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/match-windows/dashboard",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Windows Dashboard: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Windows Dashboard: Status %s", response.status_code)
 
     def test_41_match_windows_count(self):
         """UI: Shows pending count badge (GET /api/v1/match-windows/pending/count)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/match-windows/pending/count",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Pending Count: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Pending Count: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 12: MESSAGING
@@ -900,19 +1342,19 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Loads chat history (GET /message/get-messages/{convoId}/{first})"""
         response = self.session.get(
             f"{self.base_url}/message/get-messages/1/0",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Message History: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Message History: Status %s", response.status_code)
 
     def test_43_message_update_poll(self):
         """UI: Polls for new messages (GET /api/v1/message/update/{convoId}/{first})"""
         response = self.session.get(
             f"{self.base_url}/api/v1/message/update/1/0",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Message Poll: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Message Poll: Status %s", response.status_code)
 
     def test_44_message_send_rest(self):
         """UI: Sends message via REST fallback (POST /message/send/{convoId})"""
@@ -920,19 +1362,19 @@ class TestUIUserJourney(unittest.TestCase):
             f"{self.base_url}/message/send/1",
             data="Test message from E2E",
             headers={"Content-Type": "text/plain"},
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Send Message: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Send Message: Status %s", response.status_code)
 
     def test_45_message_mark_read(self):
         """UI: Marks messages as read (POST /message/read/{conversationId})"""
         response = self.session.post(
             f"{self.base_url}/message/read/1",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Mark Read: Status {response.status_code}")
+        self.assertIn(response.status_code, RESOURCE_LOOKUP)
+        LOG.info("    Mark Read: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 13: VIDEO DATES
@@ -943,28 +1385,28 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Shows upcoming video dates (GET /api/v1/video-date/upcoming)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/video-date/upcoming",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Upcoming Dates: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Upcoming Dates: Status %s", response.status_code)
 
     def test_47_video_date_proposals(self):
         """UI: Shows pending proposals (GET /api/v1/video-date/proposals)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/video-date/proposals",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date Proposals: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Date Proposals: Status %s", response.status_code)
 
     def test_48_video_date_history(self):
         """UI: Shows past video dates (GET /api/v1/video-date/history)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/video-date/history",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date History: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Date History: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 14: LOCATION & DATE SPOTS
@@ -975,37 +1417,37 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets user location areas (GET /location/areas)"""
         response = self.session.get(
             f"{self.base_url}/location/areas",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Location Areas: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Location Areas: Status %s", response.status_code)
 
     def test_50_location_preferences(self):
         """UI: Gets location preferences (GET /location/preferences)"""
         response = self.session.get(
             f"{self.base_url}/location/preferences",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Location Prefs: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Location Prefs: Status %s", response.status_code)
 
     def test_51_date_spots(self):
         """UI: Shows nearby date spots (GET /location/date-spots)"""
         response = self.session.get(
             f"{self.base_url}/location/date-spots",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date Spots: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Date Spots: Status %s", response.status_code)
 
     def test_52_safe_date_spots(self):
         """UI: Shows safe/well-lit date spots (GET /location/date-spots/safe)"""
         response = self.session.get(
             f"{self.base_url}/location/date-spots/safe",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Safe Spots: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Safe Spots: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 15: REPUTATION & ACCOUNTABILITY
@@ -1016,28 +1458,28 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Shows my reputation score (GET /api/v1/reputation/me)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/reputation/me",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    My Reputation: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    My Reputation: Status %s", response.status_code)
 
     def test_54_reputation_badges(self):
         """UI: Shows earned badges (GET /api/v1/reputation/badges)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/reputation/badges",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Badges: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Badges: Status %s", response.status_code)
 
     def test_55_accountability_categories(self):
         """UI: Gets report categories (GET /api/v1/accountability/categories)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/accountability/categories",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Report Categories: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Report Categories: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 16: RELATIONSHIP STATUS
@@ -1048,28 +1490,28 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets relationship type options (GET /api/v1/relationship/types)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/relationship/types",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Relationship Types: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Relationship Types: Status %s", response.status_code)
 
     def test_57_relationships_list(self):
         """UI: Gets current relationships (GET /api/v1/relationship)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/relationship",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Relationships: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Relationships: Status %s", response.status_code)
 
     def test_58_pending_requests(self):
         """UI: Gets pending requests (GET /api/v1/relationship/requests/pending)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/relationship/requests/pending",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Pending Requests: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Pending Requests: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 17: POLITICAL ASSESSMENT
@@ -1080,19 +1522,19 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets political assessment status (GET /api/v1/political-assessment/status)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/political-assessment/status",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Political Status: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Political Status: Status %s", response.status_code)
 
     def test_60_political_options(self):
         """UI: Gets political options (GET /api/v1/political-assessment/options)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/political-assessment/options",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Political Options: Status {response.status_code}")
+        self.assertIn(response.status_code, AUTH_REQUIRED)
+        LOG.info("    Political Options: Status %s", response.status_code)
 
     # =========================================================
     # STAGE 18: DONATIONS & STRIPE
@@ -1103,944 +1545,352 @@ class TestUIUserJourney(unittest.TestCase):
         """UI: Gets donation tiers (GET /api/v1/donation/info)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/donation/info",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403, 404])
-        print(f"    Donation Info: Status {response.status_code}")
+        self.assertIn(response.status_code, OPTIONAL_FEATURE)
+        LOG.info("    Donation Info: Status %s", response.status_code)
 
     def test_62_stripe_config(self):
         """UI: Gets Stripe publishable key (GET /api/v1/stripe/config)"""
         response = self.session.get(
             f"{self.base_url}/api/v1/stripe/config",
-            timeout=REQUEST_TIMEOUT
+            timeout=PROBE_TIMEOUT
         )
-        self.assertIn(response.status_code, [200, 302, 401, 403, 404])
-        print(f"    Stripe Config: Status {response.status_code}")
+        self.assertIn(response.status_code, OPTIONAL_FEATURE)
+        LOG.info("    Stripe Config: Status %s", response.status_code)
 
 
-class TestCoreDatingFlows(unittest.TestCase):
+class TestCoreDatingFlows(EndpointProbeMixin, unittest.TestCase):
     """
     Legacy Core Dating Flow Tests - Kept for backward compatibility
     See TestUIUserJourney for comprehensive UI-aligned tests
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES["aura-app"].url
-        cls.session = requests.Session()
-        cls.test_email = f"e2e_test_{int(time.time())}@test.alovoa.com"
-
-    def test_01_captcha_generation(self):
-        """Test captcha can be generated for registration"""
-        response = self.session.get(f"{self.base_url}/captcha/generate", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Captcha Generation: Status {response.status_code}")
-
-    def test_02_login_page_accessible(self):
-        """Test login page is accessible"""
-        response = self.session.get(f"{self.base_url}/login", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302])
-        print(f"    Login Page: Status {response.status_code}")
-
-    # =========================================
-    # 2. Profile & Search Endpoints
-    # =========================================
-
-    def test_04_search_users_default(self):
-        """Test search users default endpoint"""
-        response = self.session.get(f"{self.base_url}/search/users/default", timeout=REQUEST_TIMEOUT)
-        # May require auth, but should not be 404/500
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Search Users Default: Status {response.status_code}")
-
-    def test_05_search_users_with_params(self):
-        """Test search users with location params"""
-        # New York coords
-        response = self.session.get(
-            f"{self.base_url}/search/users/40.7128/-74.0060/50/0",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Search Users (geo): Status {response.status_code}")
-
-    def test_06_daily_matches_endpoint(self):
-        """Test daily matches recommendation endpoint"""
-        response = self.session.get(f"{self.base_url}/matching/daily", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Daily Matches: Status {response.status_code}")
-
-    # =========================================
-    # 3. User Interaction Endpoints
-    # =========================================
-
-    def test_07_like_endpoint_format(self):
-        """Test like endpoint accepts correct format"""
-        # Test with fake UUID - should fail gracefully
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.post(
-            f"{self.base_url}/user/like/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
-        )
-        # Should require auth or return user not found
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Like Endpoint: Status {response.status_code}")
-
-    def test_08_block_endpoint_format(self):
-        """Test block endpoint accepts correct format"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.post(
-            f"{self.base_url}/user/block/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Block Endpoint: Status {response.status_code}")
-
-    def test_09_report_endpoint_format(self):
-        """Test report endpoint accepts correct format"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.post(
-            f"{self.base_url}/user/report/{fake_uuid}",
-            data="Test report reason",
-            headers={"Content-Type": "text/plain"},
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Report Endpoint: Status {response.status_code}")
-
-    # =========================================
-    # 4. Messaging Endpoints
-    # =========================================
-
-    def test_10_message_send_endpoint_format(self):
-        """Test message send endpoint format"""
-        response = self.session.post(
-            f"{self.base_url}/message/send/1",
-            data="Hello, this is a test message",
-            headers={"Content-Type": "text/plain"},
-            timeout=REQUEST_TIMEOUT
-        )
-        # Should require auth
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Message Send: Status {response.status_code}")
-
-    def test_11_message_get_endpoint_format(self):
-        """Test get messages endpoint format"""
-        response = self.session.get(
-            f"{self.base_url}/message/get-messages/1/0",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Message Get: Status {response.status_code}")
-
-    def test_12_message_read_endpoint(self):
-        """Test mark message as read endpoint"""
-        response = self.session.post(
-            f"{self.base_url}/message/read/1",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Message Read: Status {response.status_code}")
-
-    # =========================================
-    # 5. Profile Update Endpoints
-    # =========================================
-
-    def test_13_update_description_endpoint(self):
-        """Test profile description update endpoint"""
-        response = self.session.post(
-            f"{self.base_url}/user/update/description",
-            data="Test bio description",
-            headers={"Content-Type": "text/plain"},
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Update Description: Status {response.status_code}")
-
-    def test_14_update_location_endpoint(self):
-        """Test location update endpoint"""
-        response = self.session.post(
-            f"{self.base_url}/user/update/location/40.7128/-74.0060",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Update Location: Status {response.status_code}")
-
-    def test_15_interest_add_endpoint(self):
-        """Test add interest endpoint"""
-        response = self.session.post(
-            f"{self.base_url}/user/interest/add/hiking",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Add Interest: Status {response.status_code}")
-
-    def test_16_interest_autocomplete(self):
-        """Test interest autocomplete endpoint"""
-        response = self.session.get(
-            f"{self.base_url}/user/interest/autocomplete/hik",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Interest Autocomplete: Status {response.status_code}")
-
-    # =========================================
-    # 6. Notification & Status Endpoints
-    # =========================================
-
-    def test_17_new_alert_status(self):
-        """Test new alert status endpoint"""
-        response = self.session.get(
-            f"{self.base_url}/user/status/new-alert",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    New Alert Status: Status {response.status_code}")
-
-    def test_18_new_message_status(self):
-        """Test new message status endpoint"""
-        response = self.session.get(
-            f"{self.base_url}/user/status/new-message",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    New Message Status: Status {response.status_code}")
-
-    def test_19_profile_completeness(self):
-        """Test profile completeness endpoint"""
-        response = self.session.get(
-            f"{self.base_url}/user/profile/completeness",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profile Completeness: Status {response.status_code}")
-
-    # =========================================
-    # 7. AURA-Specific Endpoints
-    # =========================================
-
-    def test_20_compatibility_check(self):
-        """Test compatibility score endpoint"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.get(
-            f"{self.base_url}/matching/compatibility/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Compatibility Check: Status {response.status_code}")
-
-    def test_21_video_date_availability(self):
-        """Test video date availability endpoint"""
-        response = self.session.get(
-            f"{self.base_url}/video-date/availability",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 401, 403, 404])
-        print(f"    Video Date Availability: Status {response.status_code}")
-
-    def test_22_reputation_view(self):
-        """Test viewing user reputation"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.get(
-            f"{self.base_url}/user/reputation/{fake_uuid}",
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Reputation View: Status {response.status_code}")
+    PROBES = [
+        # 1. Registration & Login
+        EndpointProbe("Captcha Generation", "GET", "/captcha/generate", PUBLIC_PAGE),
+        EndpointProbe("Login Page", "GET", "/login", PUBLIC_PAGE),
+
+        # 2. Profile & Search Endpoints (may require auth, but should not be 404/500)
+        EndpointProbe("Search Users Default", "GET", "/search/users/default", AUTH_REQUIRED),
+        EndpointProbe("Search Users (geo)", "GET", "/search/users/40.7128/-74.0060/50/0", AUTH_REQUIRED),
+        EndpointProbe("Daily Matches", "GET", "/matching/daily", AUTH_REQUIRED),
+
+        # 3. User Interaction Endpoints (fake UUID - should fail gracefully)
+        EndpointProbe("Like Endpoint", "POST", f"/user/like/{FAKE_UUID}", RESOURCE_LOOKUP),
+        EndpointProbe("Block Endpoint", "POST", f"/user/block/{FAKE_UUID}", RESOURCE_LOOKUP),
+        EndpointProbe("Report Endpoint", "POST", f"/user/report/{FAKE_UUID}", RESOURCE_LOOKUP,
+                      {"data": "Test report reason", "headers": {"Content-Type": "text/plain"}}),
+
+        # 4. Messaging Endpoints
+        EndpointProbe("Message Send", "POST", "/message/send/1", RESOURCE_LOOKUP,
+                      {"data": "Hello, this is a test message", "headers": {"Content-Type": "text/plain"}}),
+        EndpointProbe("Message Get", "GET", "/message/get-messages/1/0", RESOURCE_LOOKUP),
+        EndpointProbe("Message Read", "POST", "/message/read/1", RESOURCE_LOOKUP),
+
+        # 5. Profile Update Endpoints
+        EndpointProbe("Update Description", "POST", "/user/update/description", INPUT_REQUIRED,
+                      {"data": "Test bio description", "headers": {"Content-Type": "text/plain"}}),
+        EndpointProbe("Update Location", "POST", "/user/update/location/40.7128/-74.0060", INPUT_REQUIRED),
+        EndpointProbe("Add Interest", "POST", "/user/interest/add/hiking", INPUT_REQUIRED),
+        EndpointProbe("Interest Autocomplete", "GET", "/user/interest/autocomplete/hik", AUTH_REQUIRED),
+
+        # 6. Notification & Status Endpoints
+        EndpointProbe("New Alert Status", "GET", "/user/status/new-alert", AUTH_REQUIRED),
+        EndpointProbe("New Message Status", "GET", "/user/status/new-message", AUTH_REQUIRED),
+        EndpointProbe("Profile Completeness", "GET", "/user/profile/completeness", AUTH_REQUIRED),
+
+        # 7. AURA-Specific Endpoints
+        EndpointProbe("Compatibility Check", "GET", f"/matching/compatibility/{FAKE_UUID}", RESOURCE_LOOKUP),
+        EndpointProbe("Video Date Availability", "GET", "/video-date/availability", OPTIONAL_FEATURE),
+        EndpointProbe("Reputation View", "GET", f"/user/reputation/{FAKE_UUID}", RESOURCE_LOOKUP),
+    ]
 
 
 # =============================================================================
 # AURA-Specific Feature Tests (Compared to Upstream)
 # =============================================================================
 
-class TestAccountabilitySystem(unittest.TestCase):
+class TestAccountabilitySystem(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Accountability System
     Tests: /api/v1/accountability/*
     Features: Public reporting, evidence submission, feedback system
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/api/v1/accountability"
-        cls.session = requests.Session()
-
-    def test_01_get_report_categories(self):
-        """Test getting available report categories"""
-        response = self.session.get(f"{self.base_url}/categories", timeout=REQUEST_TIMEOUT)
+    BASE_PATH = "/api/v1/accountability"
+    PROBES = [
         # Public endpoint should be accessible
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Report Categories: Status {response.status_code}")
-
-    def test_02_submitted_reports(self):
-        """Test getting user's submitted reports"""
-        response = self.session.get(f"{self.base_url}/reports/submitted", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Submitted Reports: Status {response.status_code}")
-
-    def test_03_received_reports(self):
-        """Test getting reports received about user"""
-        response = self.session.get(f"{self.base_url}/reports/received", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Received Reports: Status {response.status_code}")
-
-    def test_04_report_submission_format(self):
-        """Test report submission endpoint format"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.post(
-            f"{self.base_url}/report",
-            json={
-                "reportedUserUuid": fake_uuid,
-                "category": "BEHAVIOR",
-                "description": "Test report",
-                "severity": "LOW"
-            },
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Report Submission: Status {response.status_code}")
-
-    def test_05_user_feedback_endpoint(self):
-        """Test getting feedback about a user"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.get(f"{self.base_url}/feedback/{fake_uuid}", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    User Feedback: Status {response.status_code}")
+        EndpointProbe("Report Categories", "GET", "/categories", AUTH_REQUIRED),
+        EndpointProbe("Submitted Reports", "GET", "/reports/submitted", AUTH_REQUIRED),
+        EndpointProbe("Received Reports", "GET", "/reports/received", AUTH_REQUIRED),
+        EndpointProbe("Report Submission", "POST", "/report", RESOURCE_LOOKUP,
+                      {"json": {"reportedUserUuid": FAKE_UUID, "category": "BEHAVIOR",
+                                "description": "Test report", "severity": "LOW"}}),
+        EndpointProbe("User Feedback", "GET", f"/feedback/{FAKE_UUID}", RESOURCE_LOOKUP),
+    ]
 
 
-class TestAssessmentSystem(unittest.TestCase):
+class TestAssessmentSystem(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Assessment/Questionnaire System
     Tests: /assessment/*
     Features: OKCupid-style questions, progress tracking, match scoring
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/assessment"
-        cls.session = requests.Session()
-
-    def test_01_get_questions_personality(self):
-        """Test getting personality assessment questions"""
-        response = self.session.get(f"{self.base_url}/questions/personality", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Personality Questions: Status {response.status_code}")
-
-    def test_02_get_questions_values(self):
-        """Test getting values assessment questions"""
-        response = self.session.get(f"{self.base_url}/questions/values", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Values Questions: Status {response.status_code}")
-
-    def test_03_get_questions_lifestyle(self):
-        """Test getting lifestyle assessment questions"""
-        response = self.session.get(f"{self.base_url}/questions/lifestyle", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Lifestyle Questions: Status {response.status_code}")
-
-    def test_04_assessment_progress(self):
-        """Test getting assessment progress"""
-        response = self.session.get(f"{self.base_url}/progress", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Assessment Progress: Status {response.status_code}")
-
-    def test_05_assessment_results(self):
-        """Test getting assessment results"""
-        response = self.session.get(f"{self.base_url}/results", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Assessment Results: Status {response.status_code}")
-
-    def test_06_next_question(self):
-        """Test getting next question to answer"""
-        response = self.session.get(f"{self.base_url}/next", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Next Question: Status {response.status_code}")
-
-    def test_07_question_batch(self):
-        """Test getting batch of questions"""
-        response = self.session.get(f"{self.base_url}/batch", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Question Batch: Status {response.status_code}")
-
-    def test_08_assessment_stats(self):
-        """Test getting assessment statistics"""
-        response = self.session.get(f"{self.base_url}/stats", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Assessment Stats: Status {response.status_code}")
-
-    def test_09_match_score_calculation(self):
-        """Test match score calculation endpoint"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.get(f"{self.base_url}/match/{fake_uuid}", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Match Score: Status {response.status_code}")
-
-    def test_10_match_explanation(self):
-        """Test match explanation endpoint"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.get(f"{self.base_url}/match/{fake_uuid}/explain", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Match Explanation: Status {response.status_code}")
-
-
-class TestIntakeAndScaffolding(unittest.TestCase):
+    BASE_PATH = "/assessment"
+    PROBES = [
+        EndpointProbe("Personality Questions", "GET", "/questions/personality", AUTH_REQUIRED),
+        EndpointProbe("Values Questions", "GET", "/questions/values", AUTH_REQUIRED),
+        EndpointProbe("Lifestyle Questions", "GET", "/questions/lifestyle", AUTH_REQUIRED),
+        EndpointProbe("Assessment Progress", "GET", "/progress", AUTH_REQUIRED),
+        EndpointProbe("Assessment Results", "GET", "/results", AUTH_REQUIRED),
+        EndpointProbe("Next Question", "GET", "/next", AUTH_REQUIRED),
+        EndpointProbe("Question Batch", "GET", "/batch", AUTH_REQUIRED),
+        EndpointProbe("Assessment Stats", "GET", "/stats", AUTH_REQUIRED),
+        EndpointProbe("Match Score", "GET", f"/match/{FAKE_UUID}", RESOURCE_LOOKUP),
+        EndpointProbe("Match Explanation", "GET", f"/match/{FAKE_UUID}/explain", RESOURCE_LOOKUP),
+    ]
+
+
+class TestIntakeAndScaffolding(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Intake Flow and Profile Scaffolding
     Tests: /intake/*
     Features: Video intro, AI analysis, profile scaffolding, encouragement
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/intake"
-        cls.session = requests.Session()
-
-    def test_01_intake_progress(self):
-        """Test getting intake progress"""
-        response = self.session.get(f"{self.base_url}/progress", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Intake Progress: Status {response.status_code}")
-
-    def test_02_core_questions(self):
-        """Test getting core intake questions"""
-        response = self.session.get(f"{self.base_url}/questions", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Core Questions: Status {response.status_code}")
-
-    def test_03_ai_status(self):
-        """Test AI provider status"""
-        response = self.session.get(f"{self.base_url}/ai/status", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    AI Status: Status {response.status_code}")
-
-    def test_04_video_tips(self):
-        """Test getting video recording tips"""
-        response = self.session.get(f"{self.base_url}/video/tips", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Video Tips: Status {response.status_code}")
-
-    def test_05_step_encouragement(self):
-        """Test getting step encouragement"""
-        response = self.session.get(f"{self.base_url}/encouragement/questions", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Step Encouragement: Status {response.status_code}")
-
-    def test_06_life_stats(self):
-        """Test personalized life stats"""
-        response = self.session.get(f"{self.base_url}/life-stats", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Life Stats: Status {response.status_code}")
-
-    def test_07_scaffolding_prompts(self):
-        """Test getting scaffolding prompts"""
-        response = self.session.get(f"{self.base_url}/scaffolding/prompts", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Scaffolding Prompts: Status {response.status_code}")
-
-    def test_08_scaffolding_progress(self):
-        """Test scaffolding progress"""
-        response = self.session.get(f"{self.base_url}/scaffolding/progress", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Scaffolding Progress: Status {response.status_code}")
-
-    def test_09_scaffolded_profile(self):
-        """Test getting scaffolded profile"""
-        response = self.session.get(f"{self.base_url}/scaffolded-profile", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Scaffolded Profile: Status {response.status_code}")
-
-
-class TestLocationSystem(unittest.TestCase):
+    BASE_PATH = "/intake"
+    PROBES = [
+        EndpointProbe("Intake Progress", "GET", "/progress", AUTH_REQUIRED),
+        EndpointProbe("Core Questions", "GET", "/questions", AUTH_REQUIRED),
+        EndpointProbe("AI Status", "GET", "/ai/status", AUTH_REQUIRED),
+        EndpointProbe("Video Tips", "GET", "/video/tips", AUTH_REQUIRED),
+        EndpointProbe("Step Encouragement", "GET", "/encouragement/questions", AUTH_REQUIRED),
+        EndpointProbe("Life Stats", "GET", "/life-stats", AUTH_REQUIRED),
+        EndpointProbe("Scaffolding Prompts", "GET", "/scaffolding/prompts", AUTH_REQUIRED),
+        EndpointProbe("Scaffolding Progress", "GET", "/scaffolding/progress", AUTH_REQUIRED),
+        EndpointProbe("Scaffolded Profile", "GET", "/scaffolded-profile", INPUT_REQUIRED),
+    ]
+
+
+class TestLocationSystem(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Location and Date Spots
     Tests: /location/*
     Features: Location areas, date spots, travel time, privacy-safe location
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/location"
-        cls.session = requests.Session()
-
-    def test_01_location_areas(self):
-        """Test getting user's location areas"""
-        response = self.session.get(f"{self.base_url}/areas", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Location Areas: Status {response.status_code}")
-
-    def test_02_location_preferences(self):
-        """Test getting location preferences"""
-        response = self.session.get(f"{self.base_url}/preferences", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Location Preferences: Status {response.status_code}")
-
-    def test_03_traveling_status(self):
-        """Test traveling status"""
-        response = self.session.get(f"{self.base_url}/traveling", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Traveling Status: Status {response.status_code}")
-
-    def test_04_date_spots(self):
-        """Test getting date spots"""
-        response = self.session.get(f"{self.base_url}/date-spots", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date Spots: Status {response.status_code}")
-
-    def test_05_safe_date_spots(self):
-        """Test getting safe/well-lit date spots"""
-        response = self.session.get(f"{self.base_url}/date-spots/safe", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Safe Date Spots: Status {response.status_code}")
-
-    def test_06_daytime_date_spots(self):
-        """Test getting daytime date spots"""
-        response = self.session.get(f"{self.base_url}/date-spots/daytime", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Daytime Date Spots: Status {response.status_code}")
-
-    def test_07_budget_date_spots(self):
-        """Test getting budget-friendly date spots"""
-        response = self.session.get(f"{self.base_url}/date-spots/budget", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Budget Date Spots: Status {response.status_code}")
-
-    def test_08_date_spot_by_type(self):
-        """Test getting date spots by type"""
-        response = self.session.get(f"{self.base_url}/date-spots/type/cafe", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date Spots By Type: Status {response.status_code}")
-
-    def test_09_location_display(self):
-        """Test display location for another user"""
-        response = self.session.get(f"{self.base_url}/display/1", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Location Display: Status {response.status_code}")
-
-    def test_10_location_overlap(self):
-        """Test checking location overlap with match"""
-        response = self.session.get(f"{self.base_url}/overlap/1", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Location Overlap: Status {response.status_code}")
-
-
-class TestMatchingAndReputation(unittest.TestCase):
+    BASE_PATH = "/location"
+    PROBES = [
+        EndpointProbe("Location Areas", "GET", "/areas", AUTH_REQUIRED),
+        EndpointProbe("Location Preferences", "GET", "/preferences", AUTH_REQUIRED),
+        EndpointProbe("Traveling Status", "GET", "/traveling", AUTH_REQUIRED),
+        EndpointProbe("Date Spots", "GET", "/date-spots", AUTH_REQUIRED),
+        EndpointProbe("Safe Date Spots", "GET", "/date-spots/safe", AUTH_REQUIRED),
+        EndpointProbe("Daytime Date Spots", "GET", "/date-spots/daytime", AUTH_REQUIRED),
+        EndpointProbe("Budget Date Spots", "GET", "/date-spots/budget", AUTH_REQUIRED),
+        EndpointProbe("Date Spots By Type", "GET", "/date-spots/type/cafe", AUTH_REQUIRED),
+        EndpointProbe("Location Display", "GET", "/display/1", RESOURCE_LOOKUP),
+        EndpointProbe("Location Overlap", "GET", "/overlap/1", RESOURCE_LOOKUP),
+    ]
+
+
+class TestMatchingAndReputation(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Matching and Reputation System
     Tests: /api/v1/matching/*, /api/v1/reputation/*
     Features: Daily matches, compatibility, reputation scoring, badges
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES['aura-app'].url
-        cls.session = requests.Session()
-
-    def test_01_daily_matches(self):
-        """Test getting daily match recommendations"""
-        response = self.session.get(f"{self.base_url}/api/v1/matching/daily", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Daily Matches: Status {response.status_code}")
-
-    def test_02_compatibility_check(self):
-        """Test compatibility score calculation"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.get(f"{self.base_url}/api/v1/matching/compatibility/{fake_uuid}", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Compatibility Check: Status {response.status_code}")
-
-    def test_03_my_reputation(self):
-        """Test getting own reputation score"""
-        response = self.session.get(f"{self.base_url}/api/v1/reputation/me", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    My Reputation: Status {response.status_code}")
-
-    def test_04_reputation_badges(self):
-        """Test getting reputation badges"""
-        response = self.session.get(f"{self.base_url}/api/v1/reputation/badges", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Reputation Badges: Status {response.status_code}")
-
-    def test_05_reputation_history(self):
-        """Test getting reputation history"""
-        response = self.session.get(f"{self.base_url}/api/v1/reputation/history", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Reputation History: Status {response.status_code}")
-
-
-class TestVideoDates(unittest.TestCase):
+    PROBES = [
+        EndpointProbe("Daily Matches", "GET", "/api/v1/matching/daily", AUTH_REQUIRED),
+        EndpointProbe("Compatibility Check", "GET", f"/api/v1/matching/compatibility/{FAKE_UUID}", RESOURCE_LOOKUP),
+        EndpointProbe("My Reputation", "GET", "/api/v1/reputation/me", AUTH_REQUIRED),
+        EndpointProbe("Reputation Badges", "GET", "/api/v1/reputation/badges", AUTH_REQUIRED),
+        EndpointProbe("Reputation History", "GET", "/api/v1/reputation/history", AUTH_REQUIRED),
+    ]
+
+
+class TestVideoDates(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Video Dating System
     Tests: /api/v1/video-date/*
     Features: Propose dates, scheduling, feedback, history
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/api/v1/video-date"
-        cls.session = requests.Session()
-
-    def test_01_upcoming_dates(self):
-        """Test getting upcoming video dates"""
-        response = self.session.get(f"{self.base_url}/upcoming", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Upcoming Dates: Status {response.status_code}")
-
-    def test_02_date_proposals(self):
-        """Test getting date proposals"""
-        response = self.session.get(f"{self.base_url}/proposals", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date Proposals: Status {response.status_code}")
-
-    def test_03_date_history(self):
-        """Test getting video date history"""
-        response = self.session.get(f"{self.base_url}/history", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Date History: Status {response.status_code}")
-
-    def test_04_propose_date_format(self):
-        """Test date proposal endpoint format"""
-        fake_uuid = "00000000-0000-0000-0000-000000000001"
-        response = self.session.post(
-            f"{self.base_url}/propose",
-            json={
-                "matchUuid": fake_uuid,
-                "proposedTime": "2026-01-15T19:00:00Z"
-            },
-            timeout=REQUEST_TIMEOUT
-        )
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403, 404])
-        print(f"    Propose Date: Status {response.status_code}")
+    BASE_PATH = "/api/v1/video-date"
+    PROBES = [
+        EndpointProbe("Upcoming Dates", "GET", "/upcoming", AUTH_REQUIRED),
+        EndpointProbe("Date Proposals", "GET", "/proposals", AUTH_REQUIRED),
+        EndpointProbe("Date History", "GET", "/history", AUTH_REQUIRED),
+        EndpointProbe("Propose Date", "POST", "/propose", RESOURCE_LOOKUP,
+                      {"json": {"matchUuid": FAKE_UUID, "proposedTime": "2026-01-15T19:00:00Z"}}),
+    ]
 
 
-class TestVideoVerification(unittest.TestCase):
+class TestVideoVerification(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Video Verification
     Tests: /video/*
     Features: Video intro upload, liveness verification
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/video"
-        cls.session = requests.Session()
-
-    def test_01_verification_status(self):
-        """Test getting verification status"""
-        response = self.session.get(f"{self.base_url}/verification/status", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Verification Status: Status {response.status_code}")
+    BASE_PATH = "/video"
+    PROBES = [
+        EndpointProbe("Verification Status", "GET", "/verification/status", AUTH_REQUIRED),
+        EndpointProbe("Start Verification", "POST", "/verification/start", INPUT_REQUIRED),
+    ]
 
-    def test_02_start_verification(self):
-        """Test starting verification"""
-        response = self.session.post(f"{self.base_url}/verification/start", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 400, 401, 403])
-        print(f"    Start Verification: Status {response.status_code}")
 
-
-class TestPoliticalAssessment(unittest.TestCase):
+class TestPoliticalAssessment(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Political/Values Assessment
     Tests: /api/v1/political-assessment/*
     Features: Political compass, economic class, reproductive views
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/api/v1/political-assessment"
-        cls.session = requests.Session()
-
-    def test_01_assessment_status(self):
-        """Test getting political assessment status"""
-        response = self.session.get(f"{self.base_url}/status", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Political Status: Status {response.status_code}")
-
-    def test_02_assessment_options(self):
-        """Test getting assessment options"""
-        response = self.session.get(f"{self.base_url}/options", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Political Options: Status {response.status_code}")
-
-    def test_03_class_consciousness_test(self):
-        """Test getting class consciousness test"""
-        response = self.session.get(f"{self.base_url}/class-consciousness-test", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Class Consciousness: Status {response.status_code}")
-
-    def test_04_explanation_prompts(self):
-        """Test getting explanation prompts"""
-        response = self.session.get(f"{self.base_url}/explanation-prompts", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Explanation Prompts: Status {response.status_code}")
-
-
-class TestProfileAndRelationship(unittest.TestCase):
+    BASE_PATH = "/api/v1/political-assessment"
+    PROBES = [
+        EndpointProbe("Political Status", "GET", "/status", AUTH_REQUIRED),
+        EndpointProbe("Political Options", "GET", "/options", AUTH_REQUIRED),
+        EndpointProbe("Class Consciousness", "GET", "/class-consciousness-test", AUTH_REQUIRED),
+        EndpointProbe("Explanation Prompts", "GET", "/explanation-prompts", AUTH_REQUIRED),
+    ]
+
+
+class TestProfileAndRelationship(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Profile and Relationship Management
     Tests: /api/profile/*, /api/v1/relationship/*
     Features: Profile visitors, relationship status, details
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES['aura-app'].url
-        cls.session = requests.Session()
-
-    def test_01_profile_visitors(self):
-        """Test getting profile visitors"""
-        response = self.session.get(f"{self.base_url}/api/profile/visitors", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profile Visitors: Status {response.status_code}")
-
-    def test_02_recent_visitors(self):
-        """Test getting recent profile visitors"""
-        response = self.session.get(f"{self.base_url}/api/profile/visitors/recent", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Recent Visitors: Status {response.status_code}")
-
-    def test_03_visited_profiles(self):
-        """Test getting profiles user visited"""
-        response = self.session.get(f"{self.base_url}/api/profile/visited", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Visited Profiles: Status {response.status_code}")
-
-    def test_04_profile_details(self):
-        """Test getting profile details"""
-        response = self.session.get(f"{self.base_url}/api/profile/details", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Profile Details: Status {response.status_code}")
-
-    def test_05_profile_details_options(self):
-        """Test getting profile detail options"""
-        response = self.session.get(f"{self.base_url}/api/profile/details/options", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Detail Options: Status {response.status_code}")
-
-    def test_06_relationships(self):
-        """Test getting user relationships"""
-        response = self.session.get(f"{self.base_url}/api/v1/relationship", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Relationships: Status {response.status_code}")
-
-    def test_07_pending_requests(self):
-        """Test getting pending relationship requests"""
-        response = self.session.get(f"{self.base_url}/api/v1/relationship/requests/pending", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Pending Requests: Status {response.status_code}")
-
-    def test_08_sent_requests(self):
-        """Test getting sent relationship requests"""
-        response = self.session.get(f"{self.base_url}/api/v1/relationship/requests/sent", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Sent Requests: Status {response.status_code}")
-
-    def test_09_relationship_types(self):
-        """Test getting relationship types"""
-        response = self.session.get(f"{self.base_url}/api/v1/relationship/types", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Relationship Types: Status {response.status_code}")
-
-
-class TestMatchWindows(unittest.TestCase):
+    PROBES = [
+        EndpointProbe("Profile Visitors", "GET", "/api/profile/visitors", AUTH_REQUIRED),
+        EndpointProbe("Recent Visitors", "GET", "/api/profile/visitors/recent", AUTH_REQUIRED),
+        EndpointProbe("Visited Profiles", "GET", "/api/profile/visited", AUTH_REQUIRED),
+        EndpointProbe("Profile Details", "GET", "/api/profile/details", AUTH_REQUIRED),
+        EndpointProbe("Detail Options", "GET", "/api/profile/details/options", AUTH_REQUIRED),
+        EndpointProbe("Relationships", "GET", "/api/v1/relationship", AUTH_REQUIRED),
+        EndpointProbe("Pending Requests", "GET", "/api/v1/relationship/requests/pending", AUTH_REQUIRED),
+        EndpointProbe("Sent Requests", "GET", "/api/v1/relationship/requests/sent", AUTH_REQUIRED),
+        EndpointProbe("Relationship Types", "GET", "/api/v1/relationship/types", AUTH_REQUIRED),
+    ]
+
+
+class TestMatchWindows(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Match Windows System
     Tests: /api/v1/match-windows/*
     Features: Time-limited matching, confirm/decline, dashboard
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = f"{SERVICES['aura-app'].url}/api/v1/match-windows"
-        cls.session = requests.Session()
-
-    def test_01_pending_windows(self):
-        """Test getting pending match windows"""
-        response = self.session.get(f"{self.base_url}/pending", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Pending Windows: Status {response.status_code}")
-
-    def test_02_waiting_windows(self):
-        """Test getting windows waiting for response"""
-        response = self.session.get(f"{self.base_url}/waiting", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Waiting Windows: Status {response.status_code}")
-
-    def test_03_confirmed_windows(self):
-        """Test getting confirmed match windows"""
-        response = self.session.get(f"{self.base_url}/confirmed", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Confirmed Windows: Status {response.status_code}")
-
-    def test_04_pending_count(self):
-        """Test getting pending window count"""
-        response = self.session.get(f"{self.base_url}/pending/count", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Pending Count: Status {response.status_code}")
-
-    def test_05_dashboard(self):
-        """Test getting match windows dashboard"""
-        response = self.session.get(f"{self.base_url}/dashboard", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Windows Dashboard: Status {response.status_code}")
-
-
-class TestEssaysAndPersonality(unittest.TestCase):
+    BASE_PATH = "/api/v1/match-windows"
+    PROBES = [
+        EndpointProbe("Pending Windows", "GET", "/pending", AUTH_REQUIRED),
+        EndpointProbe("Waiting Windows", "GET", "/waiting", AUTH_REQUIRED),
+        EndpointProbe("Confirmed Windows", "GET", "/confirmed", AUTH_REQUIRED),
+        EndpointProbe("Pending Count", "GET", "/pending/count", AUTH_REQUIRED),
+        EndpointProbe("Windows Dashboard", "GET", "/dashboard", AUTH_REQUIRED),
+    ]
+
+
+class TestEssaysAndPersonality(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Essays and Personality System
     Tests: /api/v1/essays/*, /personality/*
     Features: Profile essays, personality assessment
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES['aura-app'].url
-        cls.session = requests.Session()
-
-    def test_01_essays(self):
-        """Test getting user essays"""
-        response = self.session.get(f"{self.base_url}/api/v1/essays", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    User Essays: Status {response.status_code}")
-
-    def test_02_essay_templates(self):
-        """Test getting essay templates"""
-        response = self.session.get(f"{self.base_url}/api/v1/essays/templates", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Essay Templates: Status {response.status_code}")
-
-    def test_03_essay_count(self):
-        """Test getting essay count"""
-        response = self.session.get(f"{self.base_url}/api/v1/essays/count", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Essay Count: Status {response.status_code}")
-
-    def test_04_personality_assessment(self):
-        """Test getting personality assessment"""
-        response = self.session.get(f"{self.base_url}/personality/assessment", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Personality Assessment: Status {response.status_code}")
-
-    def test_05_personality_results(self):
-        """Test getting personality results"""
-        response = self.session.get(f"{self.base_url}/personality/results", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Personality Results: Status {response.status_code}")
-
-
-class TestWaitlistAndVerification(unittest.TestCase):
+    PROBES = [
+        EndpointProbe("User Essays", "GET", "/api/v1/essays", AUTH_REQUIRED),
+        EndpointProbe("Essay Templates", "GET", "/api/v1/essays/templates", AUTH_REQUIRED),
+        EndpointProbe("Essay Count", "GET", "/api/v1/essays/count", AUTH_REQUIRED),
+        EndpointProbe("Personality Assessment", "GET", "/personality/assessment", AUTH_REQUIRED),
+        EndpointProbe("Personality Results", "GET", "/personality/results", AUTH_REQUIRED),
+    ]
+
+
+class TestWaitlistAndVerification(EndpointProbeMixin, unittest.TestCase):
     """
     E2E Tests for Waitlist and General Verification
     Tests: /api/v1/waitlist/*, /verification/*
     Features: Waitlist signup, verification status
     """
 
-    @classmethod
-    def setUpClass(cls):
-        cls.base_url = SERVICES['aura-app'].url
-        cls.session = requests.Session()
-
-    def test_01_waitlist_status(self):
-        """Test getting waitlist status"""
-        response = self.session.get(f"{self.base_url}/api/v1/waitlist/status", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Waitlist Status: Status {response.status_code}")
-
-    def test_02_waitlist_count(self):
-        """Test getting waitlist count"""
-        response = self.session.get(f"{self.base_url}/api/v1/waitlist/count", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Waitlist Count: Status {response.status_code}")
-
-    def test_03_waitlist_stats(self):
-        """Test getting waitlist statistics"""
-        response = self.session.get(f"{self.base_url}/api/v1/waitlist/stats", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Waitlist Stats: Status {response.status_code}")
-
-    def test_04_verification_page(self):
-        """Test verification page accessibility"""
-        response = self.session.get(f"{self.base_url}/verification", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Verification Page: Status {response.status_code}")
-
-    def test_05_verification_api_status(self):
-        """Test verification API status"""
-        response = self.session.get(f"{self.base_url}/verification/api/status", timeout=REQUEST_TIMEOUT)
-        self.assertIn(response.status_code, [200, 302, 401, 403])
-        print(f"    Verification API Status: Status {response.status_code}")
+    PROBES = [
+        EndpointProbe("Waitlist Status", "GET", "/api/v1/waitlist/status", AUTH_REQUIRED),
+        EndpointProbe("Waitlist Count", "GET", "/api/v1/waitlist/count", AUTH_REQUIRED),
+        EndpointProbe("Waitlist Stats", "GET", "/api/v1/waitlist/stats", AUTH_REQUIRED),
+        EndpointProbe("Verification Page", "GET", "/verification", AUTH_REQUIRED),
+        EndpointProbe("Verification API Status", "GET", "/verification/api/status", AUTH_REQUIRED),
+    ]
 
 
 class TestIntegrationScenarios(unittest.TestCase):
     """Integration scenarios testing multiple services together"""
 
+    @classmethod
+    def setUpClass(cls):
+        ai_url = SERVICES["ai-service"].url
+        cls.embedding_url = f"{ai_url}/embedding/generate"
+        cls.batch_matching_url = f"{ai_url}/matching/batch"
+
     def test_service_to_service_communication(self):
         """Verify services can communicate with each other"""
         # This tests that the network configuration is correct
-        aura_url = SERVICES["aura-app"].url
-        media_url = SERVICES["media-service"].url
-        ai_url = SERVICES["ai-service"].url
 
-        # All services should be reachable
-        for name, url in [("AURA", aura_url), ("Media", media_url), ("AI", ai_url)]:
-            response = requests.get(f"{url}/health" if name != "AURA" else f"{url}/actuator/health", timeout=5)
-            self.assertEqual(response.status_code, 200)
+        # All services should be reachable; checked concurrently over the
+        # shared pool so the test costs one round-trip, not three
+        def check(service):
+            return SESSION.get(service.health_url, timeout=5)
+
+        with ThreadPoolExecutor(max_workers=len(SERVICES)) as executor:
+            responses = list(executor.map(check, SERVICES.values()))
+
+        for service, response in zip(SERVICES.values(), responses):
+            self.assertEqual(response.status_code, 200, service.name)
 
-        print("    Service Communication: All services reachable")
+        LOG.info("    Service Communication: All services reachable")
 
+    @unittest.skipIf(MOCK_MODE, "AI routes are not mocked")
     def test_end_to_end_matching_flow(self):
         """Test end-to-end matching flow simulation"""
-        ai_url = SERVICES["ai-service"].url
-
-        # Create two compatible profiles
-        profile_a = {
-            "user_id": 1001,
-            "personality": {"openness": 80, "conscientiousness": 70, "extraversion": 65, "agreeableness": 85, "neuroticism": 30},
-            "values": {"progressive": 75, "egalitarian": 80},
-            "lifestyle": {"social": 65, "health": 75, "work_life": 60, "finance": 70},
-            "attachment": {"anxiety": 20, "avoidance": 15}
-        }
-
-        profile_b = {
-            "user_id": 1002,
-            "personality": {"openness": 75, "conscientiousness": 75, "extraversion": 60, "agreeableness": 80, "neuroticism": 35},
-            "values": {"progressive": 70, "egalitarian": 85},
-            "lifestyle": {"social": 60, "health": 80, "work_life": 65, "finance": 65},
-            "attachment": {"anxiety": 25, "avoidance": 20}
-        }
-
-        # Step 1: Generate embeddings
-        embed_a = requests.post(f"{ai_url}/embedding/generate", json={"profile": profile_a}, timeout=10)
-        embed_b = requests.post(f"{ai_url}/embedding/generate", json={"profile": profile_b}, timeout=10)
+        # The steps only depend on the fixed profiles, not on each other's
+        # results, so all requests are issued concurrently.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 1: Generate embeddings
+            embed_a_future = executor.submit(SESSION.post, self.embedding_url,
+                                             data=SEEKER_EMBEDDING_BODY, headers=JSON_HEADERS, timeout=10)
+            embed_b_future = executor.submit(SESSION.post, self.embedding_url,
+                                             data=COMPATIBLE_EMBEDDING_BODY, headers=JSON_HEADERS, timeout=10)
+
+            # Step 2: Batch match (find best match for A among candidates).
+            # The batch result carries the A<->B compatibility score, so no
+            # separate /compatibility/score call is needed.
+            match_future = executor.submit(SESSION.post, self.batch_matching_url,
+                                           data=SEEKER_MATCHING_BODY, headers=JSON_HEADERS, timeout=10)
+
+        embed_a = embed_a_future.result()
+        embed_b = embed_b_future.result()
         self.assertEqual(embed_a.status_code, 200)
         self.assertEqual(embed_b.status_code, 200)
 
-        # Step 2: Calculate compatibility
-        compat = requests.post(f"{ai_url}/compatibility/score",
-                              json={"user1": profile_a, "user2": profile_b}, timeout=10)
-        self.assertEqual(compat.status_code, 200)
-        score = compat.json()["overall_score"]
-
-        # Step 3: Batch match (find best match for A among candidates)
-        candidates = [profile_b, {
-            "user_id": 1003,
-            "personality": {"openness": 40, "conscientiousness": 50, "extraversion": 80, "agreeableness": 50, "neuroticism": 60},
-            "values": {"progressive": 30, "egalitarian": 40},
-            "lifestyle": {"social": 90, "health": 30, "work_life": 40, "finance": 45},
-            "attachment": {"anxiety": 60, "avoidance": 50}
-        }]
-
-        match_result = requests.post(f"{ai_url}/matching/batch",
-                                    json={"target": profile_a, "candidates": candidates, "limit": 2},
-                                    timeout=10)
+        match_result = match_future.result()
         self.assertEqual(match_result.status_code, 200)
         matches = match_result.json()["matches"]
 
         # The compatible profile should rank higher
-        self.assertEqual(matches[0]["user_id"], 1002)
+        self.assertEqual(matches[0]["user_id"], PROFILE_COMPATIBLE["user_id"])
+        score = matches[0]["score"]
+        self.assertGreaterEqual(score, 0)
+        self.assertLessEqual(score, 100)
 
-        print(f"    E2E Matching Flow: Complete")
-        print(f"      - Embeddings generated: 2")
-        print(f"      - Compatibility score: {score:.1f}%")
-        print(f"      - Best match: User {matches[0]['user_id']} ({matches[0]['score']:.1f}%)")
+        LOG.info("    E2E Matching Flow: Complete")
+        LOG.info("      - Embeddings generated: 2")
+        LOG.info("      - Compatibility score: %.1f%%", score)
+        LOG.info("      - Best match: User %s (%.1f%%)", matches[0]['user_id'], matches[0]['score'])
 
 
 # =============================================================================
@@ -2068,10 +1918,12 @@ def print_summary(result: unittest.TestResult):
     total = result.testsRun
     failures = len(result.failures)
     errors = len(result.errors)
-    passed = total - failures - errors
+    skipped = len(result.skipped)
+    passed = total - failures - errors - skipped
 
     print(f"   Total Tests: {total}")
     print(f"   Passed: {passed}")
+    print(f"   Skipped: {skipped}")
     print(f"   Failures: {failures}")
     print(f"   Errors: {errors}")
 
@@ -2099,6 +1951,19 @@ def print_summary(result: unittest.TestResult):
 
 def main():
     """Main test runner"""
+    workers = os.getenv("E2E_PARALLEL")
+    if workers:
+        # Whole classes per worker: the file is a single module, so
+        # loadfile would put every test on one worker
+        import pytest
+        sys.exit(pytest.main([__file__, "-v", "-n", workers, "--dist=loadscope"]))
+
+    # Diagnostics are buffered and written in one go after the run instead
+    # of a write per line; errors still flush the buffer immediately
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    log_buffer = logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, logging.ERROR, console)
+    logging.basicConfig(level=logging.INFO, handlers=[log_buffer])
     print_banner()
 
     # Create test suite
@@ -2138,6 +2003,7 @@ def main():
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
+    log_buffer.flush()
 
     # Print summary
     success = print_summary(result)